@@ -1,20 +1,22 @@
 """Generate FHIR R4-compliant fixture data for mock EMR.
 
 NPI COORDINATION:
-    This file replicates the exact seed (42) and random/Faker call sequence from
-    synthetic_data/generate.py to produce matching provider NPIs. If the call
+    This file replicates the exact seed (42) and random-module call sequence from
+    synthetic_data/generate.py to produce matching provider NPIs. Faker and uuid
+    draw from their own entropy, so only random-module calls matter. If the call
     sequence in generate.py changes, this file MUST be updated to match.
 
     Sequence replicated:
-    1. Faker.seed(42), random.seed(42)
-    2. generate_states() -> 10 states (burns 10 uuid4 calls)
-    3. generate_physicians(count=10) -> 10 physicians (burns random + Faker calls; captures physician NPIs)
-    4. generate_providers(count=30) -> 30 providers (captures provider NPIs we reuse here)
+    1. random.seed(42)
+    2. generate_states() -> 10 states (draws nothing from random)
+    3. generate_physicians(count=10) -> random.choices(states, k=10), 10 NPIs,
+       random.choices(SPECIALTIES, k=10)
+    4. generate_providers(count=30) -> random.choices(physicians, k=30),
+       random.choices(states, k=30), then the 30 provider NPIs we reuse here
 """
 
 import json
 import random
-import uuid
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -119,39 +121,23 @@ def _replicate_oltp_seed_sequence() -> list[str]:
     This is tightly coupled to generate.py. If that file's seed sequence changes,
     this function MUST be updated to match.
     """
-    fake = Faker()
-    Faker.seed(42)
     random.seed(42)
 
-    # 1. generate_states() burns 10 uuid4() calls
-    for _ in range(10):
-        uuid.uuid4()
+    # generate_states() draws nothing from random; Faker and uuid4() use their own
+    # entropy sources, so only the random-module calls below affect the NPIs.
 
-    # 2. generate_physicians(count=10) — burn calls per physician:
-    #    random.choice(states), fake.first_name(), fake.last_name(),
-    #    generate_npi(), random.choice(SPECIALTIES), fake.phone_number()
+    # 1. generate_physicians(count=10) draws each field for the whole batch:
+    #    random.choices(states), generate_npi() per physician, random.choices(SPECIALTIES)
+    random.choices(range(10), k=10)
     for _ in range(10):
-        random.choice(range(10))  # random.choice(states)
-        fake.first_name()
-        fake.last_name()
         _generate_npi()  # burns random.choice + 9x random.randint
-        random.choice(SPECIALTIES)
-        uuid.uuid4()  # physician id
-        fake.phone_number()
-
-    # 3. generate_providers(count=30) — capture NPIs
-    provider_npis = []
-    for _ in range(30):
-        random.choice(range(10))  # random.choice(physicians)
-        random.choice(range(10))  # random.choice(states)
-        fake.first_name()
-        fake.last_name()
-        npi = _generate_npi()
-        provider_npis.append(npi)
-        random.choice(["NP", "PA"])  # provider_type
-        uuid.uuid4()  # provider id
-        fake.phone_number()
-        fake.date_between(start_date="-5y", end_date="-30d")
+    random.choices(SPECIALTIES, k=10)
+
+    # 2. generate_providers(count=30) — random.choices(physicians), random.choices(states),
+    #    then the NPIs we capture
+    random.choices(range(10), k=30)
+    random.choices(range(10), k=30)
+    provider_npis = [_generate_npi() for _ in range(30)]
 
     return provider_npis
 
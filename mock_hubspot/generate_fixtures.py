@@ -2,116 +2,181 @@
 """Generate HubSpot v3 API fixtures from Faker data.
 
 Run once to create JSON fixtures, then the mock serves them statically.
+Each record draws from an RNG seeded by its object type and index, so output is
+deterministic whether records are built serially or across a process pool.
 """
 
-import json
 import random
-from datetime import timedelta
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from functools import partial
+from multiprocessing import Pool
 from pathlib import Path
 
+import orjson
 from faker import Faker
 
+SEED = 42
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.000Z"
+
+# Below this many records, worker startup costs more than it saves
+PARALLEL_THRESHOLD = 20_000
+
+# Property value sets
+JOB_TITLES = ["Healthcare Administrator", "Practice Manager", "Medical Director", "CFO", "CEO"]
+LIFECYCLE_STAGES = ["subscriber", "lead", "marketingqualifiedlead", "customer"]
+LEAD_STATUSES = ["NEW", "OPEN", "IN_PROGRESS", "QUALIFIED"]
+COMPANY_SUFFIXES = [" Health", " Medical", ""]
+INDUSTRIES = ["Hospital & Health Care", "Medical Practice", "Pharmaceuticals"]
+EMPLOYEE_COUNTS = ["50", "100", "250", "500", "1000"]
+DEAL_STAGES = ["appointmentscheduled", "qualifiedtobuy", "closedwon", "closedlost"]
+
+# Size of the pregenerated value pools records draw from; names get a larger
+# pool so first/last combinations (and the emails built from them) stay varied
+POOL_SIZE = 256
+NAME_POOL_SIZE = 1024
+
 fake = Faker()
-Faker.seed(42)
-random.seed(42)
+fake.seed_instance(SEED)
+
+# Faker provider calls dominate record construction, so values are generated
+# once here and records only sample them with their own RNG
+FIRST_NAMES = [fake.first_name() for _ in range(NAME_POOL_SIZE)]
+LAST_NAMES = [fake.last_name() for _ in range(NAME_POOL_SIZE)]
+DOMAINS = [fake.domain_name() for _ in range(POOL_SIZE)]
+COMPANY_NAMES = [fake.company() for _ in range(POOL_SIZE)]
+PHONES = [fake.phone_number() for _ in range(POOL_SIZE)]
+CITIES = [fake.city() for _ in range(POOL_SIZE)]
+STATE_ABBRS = [fake.state_abbr() for _ in range(POOL_SIZE)]
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+def _record_rng(object_type: str, i: int) -> random.Random:
+    """Return an RNG seeded from a record's object type and index."""
+    return random.Random(f"{SEED}:{object_type}:{i}")
+
+
+def _created_window(days: int) -> tuple[int, int]:
+    """Return (start, end) epoch seconds spanning the last `days` days."""
+    end = int(datetime.now(UTC).timestamp())
+    return end - days * 86400, end
+
+
+def _build_records(make_record: Callable[[int], dict], count: int) -> list[dict]:
+    """Build count records, fanning out to a process pool for large counts."""
+    if count < PARALLEL_THRESHOLD:
+        return [make_record(i) for i in range(count)]
+    with Pool() as pool:
+        return list(pool.imap(make_record, range(count), chunksize=256))
+
+
+def _make_contact(window: tuple[int, int], i: int) -> dict:
+    """Build one contact in HubSpot v3 API format, created within window (epoch seconds)."""
+    rng = _record_rng("contacts", i)
+    first_name = rng.choice(FIRST_NAMES)
+    last_name = rng.choice(LAST_NAMES)
+    created = datetime.fromtimestamp(rng.randint(*window), UTC)
+    updated = created + timedelta(days=rng.randint(0, 30))
+    record_id = str(i + 1)
+    created_s = created.strftime(TIMESTAMP_FORMAT)
+    updated_s = updated.strftime(TIMESTAMP_FORMAT)
+
+    return {
+        "id": record_id,
+        "properties": {
+            "firstname": first_name,
+            "lastname": last_name,
+            "email": f"{first_name.lower()}.{last_name.lower()}@{rng.choice(DOMAINS)}",
+            "phone": rng.choice(PHONES),
+            "company": rng.choice(COMPANY_NAMES),
+            "jobtitle": rng.choice(JOB_TITLES),
+            "lifecyclestage": rng.choice(LIFECYCLE_STAGES),
+            "hs_lead_status": rng.choice(LEAD_STATUSES),
+            "createdate": created_s,
+            "lastmodifieddate": updated_s,
+            "hs_lastmodifieddate": updated_s,
+            "hs_object_id": record_id,
+        },
+        "createdAt": created_s,
+        "updatedAt": updated_s,
+        "archived": False,
+    }
+
+
+def _make_company(window: tuple[int, int], i: int) -> dict:
+    """Build one company in HubSpot v3 API format, created within window (epoch seconds)."""
+    rng = _record_rng("companies", i)
+    created = datetime.fromtimestamp(rng.randint(*window), UTC)
+    updated = created + timedelta(days=rng.randint(0, 30))
+    record_id = str(i + 1)
+    created_s = created.strftime(TIMESTAMP_FORMAT)
+    updated_s = updated.strftime(TIMESTAMP_FORMAT)
+
+    return {
+        "id": record_id,
+        "properties": {
+            "name": rng.choice(COMPANY_NAMES) + rng.choice(COMPANY_SUFFIXES),
+            "domain": rng.choice(DOMAINS),
+            "industry": rng.choice(INDUSTRIES),
+            "numberofemployees": rng.choice(EMPLOYEE_COUNTS),
+            "city": rng.choice(CITIES),
+            "state": rng.choice(STATE_ABBRS),
+            "createdate": created_s,
+            "lastmodifieddate": updated_s,
+            "hs_lastmodifieddate": updated_s,
+            "hs_object_id": record_id,
+        },
+        "createdAt": created_s,
+        "updatedAt": updated_s,
+        "archived": False,
+    }
+
+
+def _make_deal(window: tuple[int, int], i: int) -> dict:
+    """Build one deal in HubSpot v3 API format, created within window (epoch seconds)."""
+    rng = _record_rng("deals", i)
+    created = datetime.fromtimestamp(rng.randint(*window), UTC)
+    updated = created + timedelta(days=rng.randint(0, 30))
+    close = created + timedelta(days=90)
+    record_id = str(i + 1)
+    created_s = created.strftime(TIMESTAMP_FORMAT)
+    updated_s = updated.strftime(TIMESTAMP_FORMAT)
+    close_s = close.strftime(TIMESTAMP_FORMAT)
+
+    return {
+        "id": record_id,
+        "properties": {
+            "dealname": f"{rng.choice(COMPANY_NAMES)} - Platform Deal",
+            "amount": str(rng.randint(10000, 500000)),
+            "dealstage": rng.choice(DEAL_STAGES),
+            "pipeline": "default",
+            "closedate": close_s,
+            "createdate": created_s,
+            "lastmodifieddate": updated_s,
+            "hs_lastmodifieddate": updated_s,
+            "hs_object_id": record_id,
+        },
+        "createdAt": created_s,
+        "updatedAt": updated_s,
+        "archived": False,
+    }
+
+
 def generate_contacts(count: int = 50) -> dict:
     """Generate contacts in HubSpot v3 API format."""
-    results = []
-    for i in range(count):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        created = fake.date_time_between(start_date="-1y", end_date="now")
-        updated = created + timedelta(days=random.randint(0, 30))
-
-        results.append(
-            {
-                "id": str(i + 1),
-                "properties": {
-                    "firstname": first_name,
-                    "lastname": last_name,
-                    "email": f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}",
-                    "phone": fake.phone_number(),
-                    "company": fake.company(),
-                    "jobtitle": random.choice(
-                        ["Healthcare Administrator", "Practice Manager", "Medical Director", "CFO", "CEO"]
-                    ),
-                    "lifecyclestage": random.choice(["subscriber", "lead", "marketingqualifiedlead", "customer"]),
-                    "hs_lead_status": random.choice(["NEW", "OPEN", "IN_PROGRESS", "QUALIFIED"]),
-                    "createdate": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "lastmodifieddate": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "hs_lastmodifieddate": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "hs_object_id": str(i + 1),
-                },
-                "createdAt": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "updatedAt": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "archived": False,
-            }
-        )
-    return {"results": results}
+    return {"results": _build_records(partial(_make_contact, _created_window(365)), count)}
 
 
 def generate_companies(count: int = 20) -> dict:
     """Generate companies in HubSpot v3 API format."""
-    results = []
-    for i in range(count):
-        created = fake.date_time_between(start_date="-1y", end_date="now")
-        updated = created + timedelta(days=random.randint(0, 30))
-
-        results.append(
-            {
-                "id": str(i + 1),
-                "properties": {
-                    "name": fake.company() + random.choice([" Health", " Medical", ""]),
-                    "domain": fake.domain_name(),
-                    "industry": random.choice(["Hospital & Health Care", "Medical Practice", "Pharmaceuticals"]),
-                    "numberofemployees": str(random.choice([50, 100, 250, 500, 1000])),
-                    "city": fake.city(),
-                    "state": fake.state_abbr(),
-                    "createdate": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "lastmodifieddate": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "hs_lastmodifieddate": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "hs_object_id": str(i + 1),
-                },
-                "createdAt": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "updatedAt": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "archived": False,
-            }
-        )
-    return {"results": results}
+    return {"results": _build_records(partial(_make_company, _created_window(365)), count)}
 
 
 def generate_deals(count: int = 30) -> dict:
     """Generate deals in HubSpot v3 API format."""
-    results = []
-    for i in range(count):
-        created = fake.date_time_between(start_date="-6m", end_date="now")
-        updated = created + timedelta(days=random.randint(0, 30))
-        close = created + timedelta(days=90)
-
-        results.append(
-            {
-                "id": str(i + 1),
-                "properties": {
-                    "dealname": f"{fake.company()} - Platform Deal",
-                    "amount": str(random.randint(10000, 500000)),
-                    "dealstage": random.choice(["appointmentscheduled", "qualifiedtobuy", "closedwon", "closedlost"]),
-                    "pipeline": "default",
-                    "closedate": close.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "createdate": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "lastmodifieddate": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "hs_lastmodifieddate": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                    "hs_object_id": str(i + 1),
-                },
-                "createdAt": created.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "updatedAt": updated.strftime("%Y-%m-%dT%H:%M:%S.000Z"),
-                "archived": False,
-            }
-        )
-    return {"results": results}
+    return {"results": _build_records(partial(_make_deal, _created_window(182)), count)}
 
 
 def generate_properties() -> dict:
@@ -302,8 +367,7 @@ def main():
 
     for filename, data in fixtures.items():
         path = FIXTURES_DIR / filename
-        with open(path, "w") as f:
-            json.dump(data, f, indent=2)
+        path.write_bytes(orjson.dumps(data))
         print(f"Generated {path}")
 
     print(f"\nFixtures generated in {FIXTURES_DIR}")
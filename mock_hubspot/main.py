@@ -1,20 +1,58 @@
 """Mock HubSpot API for Singer/Meltano tap-hubspot compatibility.
 
 Serves JSON fixtures in HubSpot v3 API format.
-Fixtures are generated on startup using Faker if they don't exist.
+Fixtures are generated using Faker if they don't exist, in a background thread
+so /health answers immediately; data endpoints return 503 until they are loaded.
 """
 
-import json
+import hashlib
+import math
+import operator
+import os
+import re
+import threading
+from collections.abc import Callable
+from contextlib import asynccontextmanager
+from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
 from fastapi import Depends, FastAPI, Header, HTTPException, Query, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
+
+
+def orjson_default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively (it already covers datetime, UUID and dataclasses)."""
+    if isinstance(obj, set | frozenset):
+        return list(obj)
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson, skipping the stdlib json encoder."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """Load fixtures off the startup path so each worker accepts connections immediately."""
+    threading.Thread(target=load_fixtures, daemon=True).start()
+    yield
+
 
 app = FastAPI(
     title="Mock HubSpot API",
     description="HubSpot CRM API mock for Singer tap-hubspot testing",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -36,18 +74,27 @@ def load_fixture(name: str) -> dict:
     """Load a JSON fixture file."""
     path = FIXTURES_DIR / f"{name}.json"
     if path.exists():
-        with open(path) as f:
-            return json.load(f)
+        return orjson.loads(path.read_bytes())
     return {"results": []}
 
 
-# Generate fixtures on module load (startup)
-generate_fixtures_if_needed()
+# Fixture data, populated by load_fixtures() once FIXTURES_READY is set
+FIXTURES_READY = threading.Event()
+# Set instead of FIXTURES_READY when the loader thread fails, so health checks surface it
+FIXTURES_ERROR: str | None = None
+CONTACTS: dict = {"results": []}
+COMPANIES: dict = {"results": []}
+DEALS: dict = {"results": []}
+PROPERTIES: dict = {}
+
+# Fixture objects indexed by id for single-object lookups
+OBJECTS_BY_ID: dict[str, dict[str, dict]] = {}
 
-CONTACTS = load_fixture("contacts")
-COMPANIES = load_fixture("companies")
-DEALS = load_fixture("deals")
-PROPERTIES = load_fixture("properties")
+# Per-object-type property columns of comparable values, used by search filters
+SEARCH_COLUMNS: dict[str, dict[str, list[Any]]] = {}
+
+# Custom object schemas served by /crm/v3/schemas (the mock defines none)
+SCHEMAS: dict[str, list[dict]] = {"results": []}
 
 # Map object type variations to canonical names
 OBJECT_ALIASES = {
@@ -60,22 +107,42 @@ OBJECT_ALIASES = {
 }
 
 
+def require_fixtures() -> None:
+    """Reject requests with 503 until fixtures have loaded, or 500 if loading failed."""
+    if FIXTURES_ERROR is not None:
+        raise HTTPException(status_code=500, detail=FIXTURES_ERROR)
+    if not FIXTURES_READY.is_set():
+        raise HTTPException(status_code=503, detail="Fixtures are still loading")
+
+
+@lru_cache(maxsize=128)
+def parse_auth(authorization: str | None, hapikey: str | None) -> str | None:
+    """Extract the token from a hapikey or Bearer header, or None if neither is present."""
+    if hapikey:
+        return hapikey
+    if authorization and authorization.startswith("Bearer "):
+        return authorization.replace("Bearer ", "")
+    return None
+
+
 def verify_auth(
     authorization: str | None = Header(None),
     hapikey: str | None = Query(None),
+    _ready: None = Depends(require_fixtures),
 ) -> str:
     """Accept either Bearer token OR hapikey query param."""
-    if hapikey:
-        return hapikey
-    if authorization and authorization.startswith("Bearer "):
-        return authorization.replace("Bearer ", "")
-    raise HTTPException(status_code=401, detail="Missing authentication")
+    token = parse_auth(authorization, hapikey)
+    if token is None:
+        raise HTTPException(status_code=401, detail="Missing authentication")
+    return token
 
 
+@lru_cache(maxsize=1024)
 def get_object_type(path: str) -> str | None:
-    """Extract and normalize object type from any URL path."""
-    for alias, canonical in OBJECT_ALIASES.items():
-        if alias in path.lower():
+    """Extract and normalize object type from the first matching segment of a (lowercase) URL path."""
+    for segment in path.split("/"):
+        canonical = OBJECT_ALIASES.get(segment)
+        if canonical:
             return canonical
     return None
 
@@ -85,8 +152,214 @@ def get_data_for_type(obj_type: str) -> dict:
     return {"contacts": CONTACTS, "companies": COMPANIES, "deals": DEALS}.get(obj_type, {"results": []})
 
 
+# Page size tap-hubspot requests by default
+DEFAULT_PAGE_LIMIT = 100
+
+
+def build_v3_page(all_results: list[dict], start_idx: int, limit: int) -> dict[str, Any]:
+    """Build a CRM v3 list response for one page of results."""
+    end_idx = min(start_idx + limit, len(all_results))
+    response: dict[str, Any] = {"results": all_results[start_idx:end_idx]}
+    if end_idx < len(all_results):
+        response["paging"] = {"next": {"after": str(end_idx)}}
+    return response
+
+
+def serialize_page(response: dict[str, Any]) -> tuple[bytes, str]:
+    """Serialize a page response and tag it with a strong ETag derived from its bytes."""
+    body = orjson.dumps(response)
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def page_response(page: tuple[bytes, str], if_none_match: str | None) -> Response:
+    """Serve a serialized page, or 304 Not Modified when the client already holds its ETag."""
+    body, etag = page
+    headers = {"ETag": etag, "Cache-Control": "private, max-age=60"}
+    # If-None-Match uses weak comparison, so a W/ prefix (often added by proxies) still matches
+    if if_none_match and (
+        if_none_match.strip() == "*" or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@lru_cache(maxsize=1024)
+def v3_page(obj_type: str, start_idx: int, limit: int) -> tuple[bytes, str]:
+    """Serialize one CRM v3 list page. Fixtures are static, so each page is only built once."""
+    return serialize_page(build_v3_page(get_data_for_type(obj_type).get("results", []), start_idx, limit))
+
+
+def build_legacy_page(obj_type: str, all_results: list[dict], start_idx: int, limit: int) -> dict[str, Any]:
+    """Build a legacy (v1/v2) paged response, each object type using its own key names."""
+    end_idx = min(start_idx + limit, len(all_results))
+    has_more = end_idx < len(all_results)
+    page = all_results[start_idx:end_idx]
+    if obj_type == "contacts":
+        response: dict[str, Any] = {"contacts": page, "has-more": has_more}
+        if has_more:
+            response["vid-offset"] = end_idx
+        return response
+    more_key = "has-more" if obj_type == "companies" else "hasMore"
+    return {obj_type: page, more_key: has_more, "offset": end_idx if has_more else None}
+
+
+@lru_cache(maxsize=1024)
+def legacy_page(obj_type: str, start_idx: int, limit: int) -> tuple[bytes, str]:
+    """Serialize one legacy paged response, built once per page like v3_page."""
+    return serialize_page(build_legacy_page(obj_type, get_data_for_type(obj_type).get("results", []), start_idx, limit))
+
+
+# Search filter operators that compare a property value against the filter value
+SEARCH_COMPARISONS: dict[str, Callable[[Any, Any], bool]] = {
+    "EQ": operator.eq,
+    "NEQ": operator.ne,
+    "LT": operator.lt,
+    "LTE": operator.le,
+    "GT": operator.gt,
+    "GTE": operator.ge,
+}
+
+# HubSpot returns 10 search results per page unless asked otherwise
+DEFAULT_SEARCH_LIMIT = 10
+
+# Plain decimal numbers only; float() alone would also accept "nan", "inf" and "1_000"
+SEARCH_NUMBER = re.compile(r"[+-]?(?:\d+(?:\.\d*)?|\.\d+)")
+
+
+def to_search_value(value: Any) -> Any:
+    """Normalize a property or filter value so numbers and timestamps (as epoch ms) compare numerically."""
+    if value is None or isinstance(value, int | float):
+        return value
+    text = str(value)
+    if SEARCH_NUMBER.fullmatch(text.strip()):
+        number = float(text)
+        if math.isfinite(number):
+            return number
+    try:
+        return datetime.fromisoformat(text).timestamp() * 1000
+    except ValueError:
+        return text.lower()
+
+
+def build_search_columns(results: list[dict]) -> dict[str, list[Any]]:
+    """Pivot object properties into one column of normalized values per property."""
+    names = {name for obj in results for name in obj.get("properties", {})}
+    return {name: [to_search_value(obj["properties"].get(name)) for obj in results] for name in names}
+
+
+def filter_matches(columns: dict[str, list[Any]], count: int, search_filter: dict) -> set[int]:
+    """Indices of objects matching a single search filter, evaluated over one property column."""
+    op = search_filter.get("operator", "EQ")
+    column = columns.get(search_filter.get("propertyName", ""), [None] * count)
+
+    if op == "HAS_PROPERTY":
+        return {i for i, value in enumerate(column) if value is not None}
+    if op == "NOT_HAS_PROPERTY":
+        return {i for i, value in enumerate(column) if value is None}
+    if op in ("IN", "NOT_IN"):
+        targets = {to_search_value(v) for v in search_filter.get("values", [])}
+        return {i for i, value in enumerate(column) if (value in targets) == (op == "IN")}
+
+    compare = SEARCH_COMPARISONS.get(op)
+    if compare is None:
+        raise HTTPException(status_code=400, detail=f"Unsupported filter operator {op}")
+    target = to_search_value(search_filter.get("value"))
+    matches = set()
+    for i, value in enumerate(column):
+        try:
+            if value is not None and compare(value, target):
+                matches.add(i)
+        except TypeError:
+            continue  # e.g. a text property compared against a number
+    return matches
+
+
+def validate_search_list(value: Any, field: str) -> list[dict]:
+    """Return a search request list field (missing means empty), rejecting anything but a list of objects."""
+    if not value:
+        return []
+    if not isinstance(value, list) or not all(isinstance(item, dict) for item in value):
+        raise ValueError(f"{field} must be a list of objects")
+    return value
+
+
+@lru_cache(maxsize=256)
+def search_matches(obj_type: str, query_key: bytes) -> tuple[int, ...]:
+    """Indices of objects matching a search query's filterGroups, in its sort order.
+
+    Fixtures are static, so results are cached by the canonical JSON of the filters and sorts.
+    """
+    query = orjson.loads(query_key)
+    columns = SEARCH_COLUMNS.get(obj_type, {})
+    count = len(get_data_for_type(obj_type).get("results", []))
+
+    # Filters within a group are ANDed; groups are ORed
+    indices = list(range(count))
+    if query["filterGroups"]:
+        matched: set[int] = set()
+        for group in query["filterGroups"]:
+            group_matches = set(indices)
+            for search_filter in group.get("filters", []):
+                group_matches &= filter_matches(columns, count, search_filter)
+            matched |= group_matches
+        indices = sorted(matched)
+
+    # Apply sorts last-to-first so the first sort is the primary key
+    for sort in reversed(query["sorts"]):
+        column = columns.get(sort.get("propertyName", ""))
+        if column is not None:
+            indices.sort(
+                key=lambda i: (column[i] is None, isinstance(column[i], str), column[i]),
+                reverse=sort.get("direction") == "DESCENDING",
+            )
+    return tuple(indices)
+
+
+def load_fixtures():
+    """Load fixtures, recording any failure so /health reports it instead of the thread dying silently."""
+    global FIXTURES_ERROR
+
+    try:
+        load_fixture_data()
+    except Exception as e:
+        FIXTURES_ERROR = f"Fixture loading failed: {e!r}"
+        print(FIXTURES_ERROR)
+
+
+def load_fixture_data():
+    """Generate fixtures if needed, load them into memory, then mark the API ready."""
+    global CONTACTS, COMPANIES, DEALS, PROPERTIES, OBJECTS_BY_ID, SEARCH_COLUMNS
+
+    generate_fixtures_if_needed()
+
+    CONTACTS = load_fixture("contacts")
+    COMPANIES = load_fixture("companies")
+    DEALS = load_fixture("deals")
+    PROPERTIES = load_fixture("properties")
+
+    OBJECTS_BY_ID = {
+        obj_type: {obj["id"]: obj for obj in get_data_for_type(obj_type).get("results", [])}
+        for obj_type in ("contacts", "companies", "deals")
+    }
+    SEARCH_COLUMNS = {
+        obj_type: build_search_columns(get_data_for_type(obj_type).get("results", []))
+        for obj_type in ("contacts", "companies", "deals")
+    }
+
+    # Serialize every page a client walks at the default limit up front
+    for obj_type in ("contacts", "companies", "deals"):
+        type_count = len(get_data_for_type(obj_type).get("results", []))
+        for page_start in range(0, max(type_count, 1), DEFAULT_PAGE_LIMIT):
+            v3_page(obj_type, page_start, DEFAULT_PAGE_LIMIT)
+            legacy_page(obj_type, page_start, DEFAULT_PAGE_LIMIT)
+
+    FIXTURES_READY.set()
+
+
 @app.get("/health")
 async def health_check():
+    if FIXTURES_ERROR is not None:
+        raise HTTPException(status_code=500, detail=FIXTURES_ERROR)
     return {"status": "healthy", "service": "mock-hubspot-api"}
 
 
@@ -125,8 +398,9 @@ async def properties_object_specific(request: Request, _token: str = Depends(ver
 @app.api_route("/crm/v3/objects/{object_type}", methods=["GET"])
 async def objects_v3(
     object_type: str,
-    limit: int = Query(default=100),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT),
     after: str | None = Query(default=None),
+    if_none_match: str | None = Header(None),
     _token: str = Depends(verify_auth),
 ):
     """CRM v3 objects list endpoint."""
@@ -134,101 +408,180 @@ async def objects_v3(
     if not canonical:
         return {"results": []}
 
-    data = get_data_for_type(canonical)
-    all_results = data.get("results", [])
+    # Clamp so every out-of-range offset shares the cached empty last page
+    start_idx = min(int(after) if after else 0, len(get_data_for_type(canonical).get("results", [])))
+    return page_response(v3_page(canonical, start_idx, limit), if_none_match)
 
-    start_idx = int(after) if after else 0
-    end_idx = min(start_idx + limit, len(all_results))
-    results = all_results[start_idx:end_idx]
 
-    response: dict[str, Any] = {"results": results}
-    if end_idx < len(all_results):
-        response["paging"] = {"next": {"after": str(end_idx)}}
-    return response
+# Action segments that share the single-object URL shape but are not object ids
+OBJECT_ACTION_PATHS = frozenset({"search", "batch"})
+
+
+@app.api_route("/crm/v3/objects/{object_type}/{object_id}", methods=["GET"])
+async def object_v3(request: Request, object_type: str, object_id: str, _token: str = Depends(verify_auth)):
+    """CRM v3 single object endpoint."""
+    if object_id.lower() in OBJECT_ACTION_PATHS:
+        return await catch_all(request, request.url.path, _token)
+    canonical = OBJECT_ALIASES.get(object_type.lower())
+    obj = OBJECTS_BY_ID.get(canonical, {}).get(object_id) if canonical else None
+    if obj is None:
+        raise HTTPException(status_code=404, detail=f"{object_type} {object_id} not found")
+    return obj
 
 
 @app.api_route("/contacts/v1/lists/all/contacts/all", methods=["GET"])
 async def contacts_legacy_all(
-    count: int = Query(default=100),
+    count: int = Query(default=DEFAULT_PAGE_LIMIT),
     vidOffset: int | None = Query(default=None),
+    if_none_match: str | None = Header(None),
     _token: str = Depends(verify_auth),
 ):
     """Legacy contacts all endpoint."""
-    all_results = CONTACTS.get("results", [])
-    start_idx = vidOffset or 0
-    end_idx = min(start_idx + count, len(all_results))
-    results = all_results[start_idx:end_idx]
-
-    response: dict[str, Any] = {"contacts": results, "has-more": end_idx < len(all_results)}
-    if end_idx < len(all_results):
-        response["vid-offset"] = end_idx
-    return response
+    start_idx = min(vidOffset or 0, len(CONTACTS.get("results", [])))
+    return page_response(legacy_page("contacts", start_idx, count), if_none_match)
 
 
 @app.api_route("/companies/v2/companies/paged", methods=["GET"])
 async def companies_legacy_paged(
-    limit: int = Query(default=100),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT),
     offset: int = Query(default=0),
+    if_none_match: str | None = Header(None),
     _token: str = Depends(verify_auth),
 ):
     """Legacy companies paged endpoint."""
-    all_results = COMPANIES.get("results", [])
-    end_idx = min(offset + limit, len(all_results))
-    return {
-        "companies": all_results[offset:end_idx],
-        "has-more": end_idx < len(all_results),
-        "offset": end_idx if end_idx < len(all_results) else None,
-    }
+    start_idx = min(offset, len(COMPANIES.get("results", [])))
+    return page_response(legacy_page("companies", start_idx, limit), if_none_match)
 
 
 @app.api_route("/deals/v1/deal/paged", methods=["GET"])
 async def deals_legacy_paged(
-    limit: int = Query(default=100),
+    limit: int = Query(default=DEFAULT_PAGE_LIMIT),
     offset: int = Query(default=0),
+    if_none_match: str | None = Header(None),
     _token: str = Depends(verify_auth),
 ):
     """Legacy deals paged endpoint."""
-    all_results = DEALS.get("results", [])
-    end_idx = min(offset + limit, len(all_results))
-    return {
-        "deals": all_results[offset:end_idx],
-        "hasMore": end_idx < len(all_results),
-        "offset": end_idx if end_idx < len(all_results) else None,
-    }
+    start_idx = min(offset, len(DEALS.get("results", [])))
+    return page_response(legacy_page("deals", start_idx, limit), if_none_match)
+
+
+# ============================================================================
+# SEARCH ENDPOINTS
+# ============================================================================
+@app.api_route("/crm/v3/objects/{object_type}/search", methods=["POST"])
+async def search_v3(object_type: str, request: Request, _token: str = Depends(verify_auth)):
+    """CRM v3 search endpoint supporting filterGroups, sorts and after/limit paging."""
+    canonical = OBJECT_ALIASES.get(object_type.lower())
+    if not canonical:
+        return {"total": 0, "results": []}
+
+    try:
+        body = await request.body()
+        query = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError as e:
+        raise HTTPException(status_code=400, detail="Invalid JSON body") from e
+
+    try:
+        if not isinstance(query, dict):
+            raise ValueError("body must be a JSON object")
+        filter_groups = validate_search_list(query.get("filterGroups"), "filterGroups")
+        for group in filter_groups:
+            for search_filter in validate_search_list(group.get("filters"), "filters"):
+                if not isinstance(search_filter.get("operator", ""), str):
+                    raise ValueError("filter operator must be a string")
+                if not isinstance(search_filter.get("propertyName", ""), str):
+                    raise ValueError("filter propertyName must be a string")
+                if not isinstance(search_filter.get("values", []), list):
+                    raise ValueError("filter values must be a list")
+        sorts = validate_search_list(query.get("sorts"), "sorts")
+        if not all(isinstance(sort.get("propertyName", ""), str) for sort in sorts):
+            raise ValueError("sort propertyName must be a string")
+        after = int(query.get("after") or 0)
+        limit = int(query.get("limit") or DEFAULT_SEARCH_LIMIT)
+    except (OverflowError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid search request: {e}") from e
+
+    query_key = orjson.dumps({"filterGroups": filter_groups, "sorts": sorts}, option=orjson.OPT_SORT_KEYS)
+    matches = search_matches(canonical, query_key)
+
+    all_results = get_data_for_type(canonical).get("results", [])
+    start_idx = min(max(after, 0), len(matches))
+    end_idx = min(start_idx + max(limit, 1), len(matches))
+    response: dict[str, Any] = {"total": len(matches), "results": [all_results[i] for i in matches[start_idx:end_idx]]}
+    if end_idx < len(matches):
+        response["paging"] = {"next": {"after": str(end_idx)}}
+    return response
+
+
+# ============================================================================
+# SCHEMA ENDPOINTS
+# ============================================================================
+@app.api_route("/crm/v3/schemas", methods=["GET"])
+async def list_schemas(_token: str = Depends(verify_auth)):
+    """CRM v3 custom object schemas list endpoint."""
+    return SCHEMAS
 
 
 # ============================================================================
 # CATCH-ALL for unhandled endpoints
 # ============================================================================
+# URL markers the catch-all dispatches on, found in a single regex scan; the
+# lookaheads keep matches zero-width so overlapping markers (e.g. "/v3/" and "/all") are all seen
+CATCH_ALL_MARKERS = re.compile(
+    r"(?=(?P<props>properties|property))"
+    r"|(?=(?P<v3>/v3/))"
+    r"|(?=(?P<paged>paged))"
+    r"|(?=(?P<all>/all))"
+    r"|(?=(?P<objs>objects|contacts|companies|deals))"
+    r"|(?=(?P<schema>schema))"
+    r"|(?=(?P<search>search))"
+)
+
+
+@lru_cache(maxsize=4096)
+def classify_url(url: str) -> tuple[str, str | None]:
+    """Classify a lowercase catch-all URL into (response kind, object type); URL shapes repeat, so this is cached."""
+    markers = {match.lastgroup for match in CATCH_ALL_MARKERS.finditer(url)}
+    obj_type = get_object_type(url)
+
+    if "props" in markers:
+        return ("properties_v3" if "v3" in markers else "properties"), obj_type
+    if "objs" in markers and obj_type:
+        for marker in ("v3", "paged", "all"):
+            if marker in markers:
+                return f"objects_{marker}", obj_type
+        return "objects", obj_type
+    if "schema" in markers:
+        return "schema", None
+    if "search" in markers:
+        return "search", None
+    return "unknown", None
+
+
 @app.api_route("/{path:path}", methods=["GET", "POST"])
 async def catch_all(request: Request, path: str, _token: str = Depends(verify_auth)):
     """Catch-all for any unhandled endpoints. Returns sensible empty responses."""
-    url = request.url.path.lower()
+    kind, obj_type = classify_url(request.url.path.lower())
 
     # Properties endpoints
-    if "properties" in url or "property" in url:
-        obj_type = get_object_type(url)
-        props = PROPERTIES.get(obj_type, [])
-        return {"results": props} if "/v3/" in url else props
+    if kind == "properties_v3":
+        return {"results": PROPERTIES.get(obj_type, [])}
+    if kind == "properties":
+        return PROPERTIES.get(obj_type, [])
 
     # Object list endpoints
-    if any(x in url for x in ["objects", "contacts", "companies", "deals"]):
-        obj_type = get_object_type(url)
-        if obj_type:
-            data = get_data_for_type(obj_type)
-            results = data.get("results", [])[:100]
-            if "/v3/" in url:
-                return {"results": results}
-            if "paged" in url:
-                return {"results": results, "has-more": False, "hasMore": False}
-            if "/all" in url:
-                return {"contacts": results, "has-more": False}
-            return {"results": results}
+    if kind.startswith("objects"):
+        results = get_data_for_type(obj_type).get("results", [])[:100]
+        if kind == "objects_paged":
+            return {"results": results, "has-more": False, "hasMore": False}
+        if kind == "objects_all":
+            return {"contacts": results, "has-more": False}
+        return {"results": results}
 
     # Schema/search endpoints
-    if "schema" in url:
+    if kind == "schema":
         return {"results": []}
-    if "search" in url:
+    if kind == "search":
         return {"total": 0, "results": []}
 
     return {"results": [], "total": 0}
@@ -236,7 +589,25 @@ async def catch_all(request: Request, path: str, _token: str = Depends(verify_au
 
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request, exc):
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=exc.status_code,
         content={"status": "error", "message": exc.detail, "correlationId": "mock-error-id"},
     )
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # Generate once up front so workers only load fixtures instead of racing to write them
+    generate_fixtures_if_needed()
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=443,
+        workers=int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="uvloop",
+        http="httptools",
+        access_log=False,
+        ssl_keyfile="/certs/key.pem",
+        ssl_certfile="/certs/cert.pem",
+    )
@@ -3,10 +3,12 @@
 Uses Faker to generate realistic healthcare provider supervision data.
 """
 
+import os
 import random
 import uuid
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from itertools import repeat
 
 from faker import Faker
 
@@ -43,6 +45,49 @@ CASE_TYPES = [
     "Imaging Review",
 ]
 
+PROVIDER_TYPES = ["NP", "PA"]
+
+# Case priorities and their cumulative weights (10% low, 60% normal, 20% high, 10% urgent)
+PRIORITIES = ["low", "normal", "high", "urgent"]
+PRIORITY_CUM_WEIGHTS = [0.1, 0.7, 0.9, 1.0]
+
+# HubSpot property value sets
+HUBSPOT_JOB_TITLES = [
+    "Healthcare Administrator",
+    "Practice Manager",
+    "Medical Director",
+    "Compliance Officer",
+    "IT Director",
+    "CFO",
+    "CEO",
+]
+HUBSPOT_LIFECYCLE_STAGES = ["subscriber", "lead", "marketingqualifiedlead", "customer"]
+HUBSPOT_LEAD_STATUSES = ["NEW", "OPEN", "IN_PROGRESS", "QUALIFIED", "UNQUALIFIED"]
+HUBSPOT_DEAL_STAGES = [
+    "appointmentscheduled",
+    "qualifiedtobuy",
+    "presentationscheduled",
+    "decisionmakerboughtin",
+    "contractsent",
+    "closedwon",
+    "closedlost",
+]
+HUBSPOT_INDUSTRIES = [
+    "Hospital & Health Care",
+    "Medical Practice",
+    "Health, Wellness and Fitness",
+    "Pharmaceuticals",
+    "Medical Devices",
+    "Biotechnology",
+]
+HUBSPOT_COMPANY_SUFFIXES = [" Health", " Medical", " Healthcare", ""]
+HUBSPOT_EMPLOYEE_COUNTS = [50, 100, 250, 500, 1000, 5000]
+# Top-level domains for HubSpot company domains, weighted towards .com like Faker's en_US list
+DOMAIN_TLDS = ["com", "com", "com", "com", "com", "com", "biz", "info", "net", "org"]
+
+# Lower bound for HubSpot timestamps, matching Faker's iso8601() default range
+UNIX_EPOCH = datetime(1970, 1, 1)
+
 # US States with supervision requirements
 STATES_DATA = [
     ("CA", "California", "Full practice authority after transition period", 30),
@@ -58,7 +103,7 @@ STATES_DATA = [
 ]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class State:
     id: str
     code: str
@@ -67,7 +112,7 @@ class State:
     review_frequency_days: int
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Physician:
     id: str
     npi: str
@@ -79,7 +124,7 @@ class Physician:
     phone: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Provider:
     id: str
     npi: str
@@ -93,7 +138,7 @@ class Provider:
     hire_date: date
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Case:
     id: str
     provider_id: str
@@ -103,9 +148,11 @@ class Case:
     priority: str
     created_at: datetime
     closed_at: datetime | None
+    # Denormalized from the case's provider so reviews need no provider lookup; not a cases column
+    supervising_physician_id: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CaseReview:
     id: str
     case_id: str
@@ -122,6 +169,41 @@ def generate_npi() -> str:
     return str(random.choice([1, 2])) + "".join(str(random.randint(0, 9)) for _ in range(9))
 
 
+def generate_uuids(count: int) -> list[str]:
+    """Generate count random (version 4) UUID strings from a single urandom read."""
+    buf = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=buf[i : i + 16], version=4)) for i in range(0, 16 * count, 16)]
+
+
+def random_iso8601s(count: int) -> list[str]:
+    """Generate count ISO 8601 timestamps between the Unix epoch and now, like fake.iso8601()."""
+    end = int(datetime.now().timestamp())
+    return [(UNIX_EPOCH + timedelta(seconds=random.randint(0, end))).isoformat() for _ in range(count)]
+
+
+def generate_phones(count: int) -> list[str]:
+    """Generate count US-style phone numbers.
+
+    Draws from Faker's RNG rather than the random module, so the NPI sequence the
+    provider replicas depend on is unaffected.
+    """
+    rng = fake.random
+    return [f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}" for _ in range(count)]
+
+
+def generate_emails(first_names: list[str], last_names: list[str], domains) -> list[str]:
+    """Build first.last@domain addresses, lowercasing each name column in one pass."""
+    return [
+        f"{first}.{last}@{domain}"
+        for first, last, domain in zip(map(str.lower, first_names), map(str.lower, last_names), domains)
+    ]
+
+
+def company_domain(company: str, tld: str) -> str:
+    """Build a domain from the first word of a company name, e.g. "Harris-Barker Ltd" -> "harrisbarker.com"."""
+    return "".join(ch for ch in company.split()[0] if ch.isalnum()).lower() + "." + tld
+
+
 def generate_mrn() -> str:
     """Generate a medical record number."""
     return f"MRN{random.randint(100000, 999999)}"
@@ -131,72 +213,97 @@ def generate_states() -> list[State]:
     """Generate state records."""
     return [
         State(
-            id=str(uuid.uuid4()),
+            id=state_id,
             code=code,
             name=name,
             supervision_requirements=req,
             review_frequency_days=freq,
         )
-        for code, name, req, freq in STATES_DATA
+        for state_id, (code, name, req, freq) in zip(generate_uuids(len(STATES_DATA)), STATES_DATA)
     ]
 
 
 def generate_physicians(states: list[State], count: int = 10) -> list[Physician]:
-    """Generate physician records."""
-    physicians = []
-    for _ in range(count):
-        state = random.choice(states)
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        physicians.append(
-            Physician(
-                id=str(uuid.uuid4()),
-                npi=generate_npi(),
-                first_name=first_name,
-                last_name=last_name,
-                specialty=random.choice(SPECIALTIES),
-                state_license_id=state.id,
-                email=f"{first_name.lower()}.{last_name.lower()}@hospital.org",
-                phone=fake.phone_number(),
-            )
+    """Generate physician records, drawing each field for the whole batch at once."""
+    license_states = random.choices(states, k=count)
+    npis = [generate_npi() for _ in range(count)]
+    specialties = random.choices(SPECIALTIES, k=count)
+    first_names = [fake.first_name() for _ in range(count)]
+    last_names = [fake.last_name() for _ in range(count)]
+    emails = generate_emails(first_names, last_names, repeat("hospital.org"))
+    phones = generate_phones(count)
+
+    return [
+        Physician(
+            id=physician_id,
+            npi=npi,
+            first_name=first_name,
+            last_name=last_name,
+            specialty=specialty,
+            state_license_id=state.id,
+            email=email,
+            phone=phone,
+        )
+        for physician_id, state, npi, specialty, first_name, last_name, email, phone in zip(
+            generate_uuids(count), license_states, npis, specialties, first_names, last_names, emails, phones
         )
-    return physicians
+    ]
 
 
 def generate_providers(physicians: list[Physician], states: list[State], count: int = 30) -> list[Provider]:
-    """Generate provider (NP/PA) records."""
-    providers = []
-    for _ in range(count):
-        physician = random.choice(physicians)
-        state = random.choice(states)
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        providers.append(
-            Provider(
-                id=str(uuid.uuid4()),
-                npi=generate_npi(),
-                first_name=first_name,
-                last_name=last_name,
-                provider_type=random.choice(["NP", "PA"]),
-                supervising_physician_id=physician.id,
-                state_id=state.id,
-                email=f"{first_name.lower()}.{last_name.lower()}@clinic.org",
-                phone=fake.phone_number(),
-                hire_date=fake.date_between(start_date="-5y", end_date="-30d"),
-            )
+    """Generate provider (NP/PA) records, drawing each field for the whole batch at once."""
+    supervisors = random.choices(physicians, k=count)
+    provider_states = random.choices(states, k=count)
+    npis = [generate_npi() for _ in range(count)]
+    provider_types = random.choices(PROVIDER_TYPES, k=count)
+    first_names = [fake.first_name() for _ in range(count)]
+    last_names = [fake.last_name() for _ in range(count)]
+    emails = generate_emails(first_names, last_names, repeat("clinic.org"))
+    phones = generate_phones(count)
+    hire_dates = [fake.date_between(start_date="-5y", end_date="-30d") for _ in range(count)]
+
+    return [
+        Provider(
+            id=provider_id,
+            npi=npi,
+            first_name=first_name,
+            last_name=last_name,
+            provider_type=provider_type,
+            supervising_physician_id=physician.id,
+            state_id=state.id,
+            email=email,
+            phone=phone,
+            hire_date=hire_date,
         )
-    return providers
+        for provider_id, physician, state, npi, provider_type, first_name, last_name, email, phone, hire_date in zip(
+            generate_uuids(count),
+            supervisors,
+            provider_states,
+            npis,
+            provider_types,
+            first_names,
+            last_names,
+            emails,
+            phones,
+            hire_dates,
+        )
+    ]
 
 
 def generate_cases(providers: list[Provider], count: int = 100) -> list[Case]:
     """Generate patient case records."""
-    cases = []
-    for _ in range(count):
-        provider = random.choice(providers)
-        created = fake.date_time_between(start_date="-90d", end_date="-1d")
+    case_providers = random.choices(providers, k=count)
+    created_ats = [fake.date_time_between(start_date="-90d", end_date="-1d") for _ in range(count)]
+    status_rolls = [random.random() for _ in range(count)]
+    mrns = [generate_mrn() for _ in range(count)]
+    case_types = random.choices(CASE_TYPES, k=count)
+    priorities = random.choices(PRIORITIES, cum_weights=PRIORITY_CUM_WEIGHTS, k=count)
 
+    cases = []
+    for case_id, provider, created, status_roll, mrn, case_type, priority in zip(
+        generate_uuids(count), case_providers, created_ats, status_rolls, mrns, case_types, priorities
+    ):
         # 70% open, 20% closed, 10% pending review
-        status_roll = random.random()
         if status_roll < 0.7:
             status = "open"
             closed_at = None
@@ -209,50 +316,43 @@ def generate_cases(providers: list[Provider], count: int = 100) -> list[Case]:
 
         cases.append(
             Case(
-                id=str(uuid.uuid4()),
+                id=case_id,
                 provider_id=provider.id,
-                patient_mrn=generate_mrn(),
-                case_type=random.choice(CASE_TYPES),
+                patient_mrn=mrn,
+                case_type=case_type,
                 status=status,
-                priority=random.choices(["low", "normal", "high", "urgent"], weights=[0.1, 0.6, 0.2, 0.1])[0],
+                priority=priority,
                 created_at=created,
                 closed_at=closed_at,
+                supervising_physician_id=provider.supervising_physician_id,
             )
         )
     return cases
 
 
-def generate_case_reviews(
-    cases: list[Case],
-    providers: list[Provider],
-    physicians: list[Physician],
-    count: int = 200,
-) -> list[CaseReview]:
+def generate_case_reviews(cases: list[Case], count: int = 200) -> list[CaseReview]:
     """Generate case review records."""
-    # Build provider -> physician mapping
-    provider_physician_map = {p.id: p.supervising_physician_id for p in providers}
-
-    reviews = []
-    for _ in range(count):
-        case = random.choice(cases)
-        physician_id = provider_physician_map.get(case.provider_id)
+    reviewed_cases = random.choices(cases, k=count)
+    due_offsets = [random.randint(7, 30) for _ in range(count)]
+    completion_rolls = [random.random() for _ in range(count)]
+    completed_early_days = [random.randint(0, 5) for _ in range(count)]
 
-        if not physician_id:
-            continue
+    today = date.today()
+    midnight = datetime.min.time()
 
+    reviews = []
+    for review_id, case, due_offset, completion_roll, completed_early in zip(
+        generate_uuids(count), reviewed_cases, due_offsets, completion_rolls, completed_early_days
+    ):
         # Due date is typically 7-30 days after case creation
-        due_date = case.created_at.date() + timedelta(days=random.randint(7, 30))
+        due_date = case.created_at.date() + timedelta(days=due_offset)
 
         # Determine review status based on due date
-        today = date.today()
         if due_date < today:
             # Past due - could be completed or overdue
-            if random.random() < 0.7:  # 70% completed
+            if completion_roll < 0.7:  # 70% completed
                 status = "completed"
-                completed_at = datetime.combine(
-                    due_date - timedelta(days=random.randint(0, 5)),
-                    datetime.min.time(),
-                )
+                completed_at = datetime.combine(due_date - timedelta(days=completed_early), midnight)
                 review_date = completed_at.date()
             else:
                 status = "overdue"
@@ -266,9 +366,9 @@ def generate_case_reviews(
 
         reviews.append(
             CaseReview(
-                id=str(uuid.uuid4()),
+                id=review_id,
                 case_id=case.id,
-                physician_id=physician_id,
+                physician_id=case.supervising_physician_id,
                 review_date=review_date,
                 review_status=status,
                 notes=fake.sentence() if status == "completed" else None,
@@ -282,76 +382,68 @@ def generate_case_reviews(
 
 def generate_hubspot_contacts(count: int = 50) -> list[dict]:
     """Generate HubSpot-style contact records."""
-    contacts = []
-    for i in range(count):
-        first_name = fake.first_name()
-        last_name = fake.last_name()
-        company = fake.company()
+    first_names = [fake.first_name() for _ in range(count)]
+    last_names = [fake.last_name() for _ in range(count)]
+    companies = [fake.company() for _ in range(count)]
+    domains = [company_domain(company, tld) for company, tld in zip(companies, random.choices(DOMAIN_TLDS, k=count))]
+    emails = generate_emails(first_names, last_names, domains)
+    phones = generate_phones(count)
+    job_titles = random.choices(HUBSPOT_JOB_TITLES, k=count)
+    lifecycle_stages = random.choices(HUBSPOT_LIFECYCLE_STAGES, k=count)
+    lead_statuses = random.choices(HUBSPOT_LEAD_STATUSES, k=count)
+    # createdate, lastmodifieddate, createdAt, updatedAt for each contact
+    timestamps = random_iso8601s(count * 4)
 
-        contacts.append(
-            {
-                "id": str(i + 1),
-                "properties": {
-                    "firstname": first_name,
-                    "lastname": last_name,
-                    "email": f"{first_name.lower()}.{last_name.lower()}@{fake.domain_name()}",
-                    "phone": fake.phone_number(),
-                    "company": company,
-                    "jobtitle": random.choice(
-                        [
-                            "Healthcare Administrator",
-                            "Practice Manager",
-                            "Medical Director",
-                            "Compliance Officer",
-                            "IT Director",
-                            "CFO",
-                            "CEO",
-                        ]
-                    ),
-                    "lifecyclestage": random.choice(["subscriber", "lead", "marketingqualifiedlead", "customer"]),
-                    "hs_lead_status": random.choice(["NEW", "OPEN", "IN_PROGRESS", "QUALIFIED", "UNQUALIFIED"]),
-                    "createdate": fake.iso8601(),
-                    "lastmodifieddate": fake.iso8601(),
-                },
-                "createdAt": fake.iso8601(),
-                "updatedAt": fake.iso8601(),
-                "archived": False,
-            }
+    return [
+        {
+            "id": str(i + 1),
+            "properties": {
+                "firstname": first_name,
+                "lastname": last_name,
+                "email": email,
+                "phone": phone,
+                "company": company,
+                "jobtitle": job_title,
+                "lifecyclestage": lifecycle_stage,
+                "hs_lead_status": lead_status,
+                "createdate": timestamps[4 * i],
+                "lastmodifieddate": timestamps[4 * i + 1],
+            },
+            "createdAt": timestamps[4 * i + 2],
+            "updatedAt": timestamps[4 * i + 3],
+            "archived": False,
+        }
+        for i, (first_name, last_name, company, email, phone, job_title, lifecycle_stage, lead_status) in enumerate(
+            zip(first_names, last_names, companies, emails, phones, job_titles, lifecycle_stages, lead_statuses)
         )
-    return contacts
+    ]
 
 
 def generate_hubspot_deals(contacts: list[dict], count: int = 30) -> list[dict]:
     """Generate HubSpot-style deal records."""
-    deals = []
-    stages = [
-        "appointmentscheduled",
-        "qualifiedtobuy",
-        "presentationscheduled",
-        "decisionmakerboughtin",
-        "contractsent",
-        "closedwon",
-        "closedlost",
-    ]
-
-    for i in range(count):
-        contact = random.choice(contacts) if contacts else None
-        stage = random.choice(stages)
+    deal_contacts = random.choices(contacts, k=count) if contacts else [None] * count
+    stages = random.choices(HUBSPOT_DEAL_STAGES, k=count)
+    amounts = [random.randint(10000, 500000) for _ in range(count)]
+    company_names = [fake.company() for _ in range(count)]
+    # hs_lastmodifieddate, createdate, createdAt, updatedAt, closedate for each deal
+    timestamps = random_iso8601s(count * 5)
 
+    deals = []
+    for i, (contact, stage, amount, company_name) in enumerate(zip(deal_contacts, stages, amounts, company_names)):
         deals.append(
             {
                 "id": str(i + 1),
                 "properties": {
-                    "dealname": f"{fake.company()} - Provider Supervision Platform",
-                    "amount": str(random.randint(10000, 500000)),
+                    "dealname": f"{company_name} - Provider Supervision Platform",
+                    "amount": str(amount),
                     "dealstage": stage,
                     "pipeline": "default",
-                    "closedate": fake.iso8601() if stage.startswith("closed") else None,
-                    "hs_lastmodifieddate": fake.iso8601(),
-                    "createdate": fake.iso8601(),
+                    "closedate": timestamps[5 * i + 4] if stage.startswith("closed") else None,
+                    "hs_lastmodifieddate": timestamps[5 * i],
+                    "createdate": timestamps[5 * i + 1],
                 },
-                "createdAt": fake.iso8601(),
-                "updatedAt": fake.iso8601(),
+                "createdAt": timestamps[5 * i + 2],
+                "updatedAt": timestamps[5 * i + 3],
                 "archived": False,
                 "associations": {"contacts": {"results": [{"id": contact["id"]}]} if contact else {"results": []}},
             }
@@ -361,69 +453,80 @@ def generate_hubspot_deals(contacts: list[dict], count: int = 30) -> list[dict]:
 
 def generate_hubspot_companies(count: int = 20) -> list[dict]:
     """Generate HubSpot-style company records."""
-    companies = []
-    industries = [
-        "Hospital & Health Care",
-        "Medical Practice",
-        "Health, Wellness and Fitness",
-        "Pharmaceuticals",
-        "Medical Devices",
-        "Biotechnology",
-    ]
+    names = [fake.company() for _ in range(count)]
+    suffixes = random.choices(HUBSPOT_COMPANY_SUFFIXES, k=count)
+    domains = [company_domain(name, tld) for name, tld in zip(names, random.choices(DOMAIN_TLDS, k=count))]
+    industries = random.choices(HUBSPOT_INDUSTRIES, k=count)
+    employee_counts = random.choices(HUBSPOT_EMPLOYEE_COUNTS, k=count)
+    revenues = [random.randint(1000000, 100000000) for _ in range(count)]
+    cities = [fake.city() for _ in range(count)]
+    state_abbrs = [fake.state_abbr() for _ in range(count)]
+    phones = generate_phones(count)
+    # createdate, hs_lastmodifieddate, createdAt, updatedAt for each company
+    timestamps = random_iso8601s(count * 4)
 
-    for i in range(count):
-        companies.append(
-            {
-                "id": str(i + 1),
-                "properties": {
-                    "name": fake.company() + random.choice([" Health", " Medical", " Healthcare", ""]),
-                    "domain": fake.domain_name(),
-                    "industry": random.choice(industries),
-                    "numberofemployees": str(random.choice([50, 100, 250, 500, 1000, 5000])),
-                    "annualrevenue": str(random.randint(1000000, 100000000)),
-                    "city": fake.city(),
-                    "state": fake.state_abbr(),
-                    "country": "United States",
-                    "phone": fake.phone_number(),
-                    "createdate": fake.iso8601(),
-                    "hs_lastmodifieddate": fake.iso8601(),
-                },
-                "createdAt": fake.iso8601(),
-                "updatedAt": fake.iso8601(),
-                "archived": False,
-            }
+    return [
+        {
+            "id": str(i + 1),
+            "properties": {
+                "name": name + suffix,
+                "domain": domain,
+                "industry": industry,
+                "numberofemployees": str(employee_count),
+                "annualrevenue": str(revenue),
+                "city": city,
+                "state": state_abbr,
+                "country": "United States",
+                "phone": phone,
+                "createdate": timestamps[4 * i],
+                "hs_lastmodifieddate": timestamps[4 * i + 1],
+            },
+            "createdAt": timestamps[4 * i + 2],
+            "updatedAt": timestamps[4 * i + 3],
+            "archived": False,
+        }
+        for i, (name, suffix, domain, industry, employee_count, revenue, city, state_abbr, phone) in enumerate(
+            zip(names, suffixes, domains, industries, employee_counts, revenues, cities, state_abbrs, phones)
         )
-    return companies
+    ]
 
 
-def generate_all_data() -> dict:
-    """Generate all synthetic data."""
+def generate_oltp_data() -> dict:
+    """Generate the OLTP tables, in dependency order."""
     states = generate_states()
     physicians = generate_physicians(states)
     providers = generate_providers(physicians, states)
     cases = generate_cases(providers)
-    case_reviews = generate_case_reviews(cases, providers, physicians)
+    case_reviews = generate_case_reviews(cases)
 
+    return {
+        "states": states,
+        "physicians": physicians,
+        "providers": providers,
+        "cases": cases,
+        "case_reviews": case_reviews,
+    }
+
+
+def generate_hubspot_data() -> dict:
+    """Generate the HubSpot objects."""
     hubspot_contacts = generate_hubspot_contacts()
     hubspot_deals = generate_hubspot_deals(hubspot_contacts)
     hubspot_companies = generate_hubspot_companies()
 
     return {
-        "oltp": {
-            "states": states,
-            "physicians": physicians,
-            "providers": providers,
-            "cases": cases,
-            "case_reviews": case_reviews,
-        },
-        "hubspot": {
-            "contacts": hubspot_contacts,
-            "deals": hubspot_deals,
-            "companies": hubspot_companies,
-        },
+        "contacts": hubspot_contacts,
+        "deals": hubspot_deals,
+        "companies": hubspot_companies,
     }
 
 
+def generate_all_data() -> dict:
+    """Generate all synthetic data."""
+    # OLTP first: the provider NPI replicas in generate_hl7.py and mock_emr depend on this draw order
+    return {"oltp": generate_oltp_data(), "hubspot": generate_hubspot_data()}
+
+
 if __name__ == "__main__":
     data = generate_all_data()
     print(f"Generated {len(data['oltp']['states'])} states")
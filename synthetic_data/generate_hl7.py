@@ -14,7 +14,6 @@ NPI + MRN COORDINATION:
 import random
 import socket
 import time
-import uuid
 from datetime import datetime, timedelta
 
 from faker import Faker
@@ -73,37 +72,18 @@ def _replicate_provider_npis() -> list[str]:
 
     Identical to mock_emr/generate_fixtures.py::_replicate_oltp_seed_sequence().
     """
-    fake = Faker()
-    Faker.seed(42)
     random.seed(42)
 
-    # 1. generate_states() burns 10 uuid4() calls
-    for _ in range(10):
-        uuid.uuid4()
-
-    # 2. generate_physicians(count=10)
+    # 1. generate_physicians(count=10): states, NPIs, specialties
+    random.choices(range(10), k=10)
     for _ in range(10):
-        random.choice(range(10))
-        fake.first_name()
-        fake.last_name()
         _generate_npi()
-        random.choice(SPECIALTIES)
-        uuid.uuid4()
-        fake.phone_number()
+    random.choices(SPECIALTIES, k=10)
 
-    # 3. generate_providers(count=30) — capture NPIs
-    provider_npis = []
-    for _ in range(30):
-        random.choice(range(10))
-        random.choice(range(10))
-        fake.first_name()
-        fake.last_name()
-        npi = _generate_npi()
-        provider_npis.append(npi)
-        random.choice(["NP", "PA"])
-        uuid.uuid4()
-        fake.phone_number()
-        fake.date_between(start_date="-5y", end_date="-30d")
+    # 2. generate_providers(count=30): physicians, states, then NPIs to capture
+    random.choices(range(10), k=30)
+    random.choices(range(10), k=30)
+    provider_npis = [_generate_npi() for _ in range(30)]
 
     return provider_npis
 
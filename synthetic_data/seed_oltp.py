@@ -1,28 +1,70 @@
 """Seed OLTP database with synthetic data."""
 
+import csv
+import io
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 
 import psycopg2
-from generate import generate_all_data
+from generate import generate_oltp_data
 from psycopg2.extras import execute_values
-
-
-def get_connection():
-    """Get database connection with retry logic."""
+from psycopg2.pool import ThreadedConnectionPool
+
+# Rows per INSERT statement; large enough that each table goes in a single round trip
+PAGE_SIZE = 1000
+
+# NULL marker for COPY ... WITH (FORMAT CSV), distinct from an empty string
+COPY_NULL = "\\N"
+
+# Opened lazily by get_connection() and shared by every seed phase in the process
+CONNECTION_POOL: ThreadedConnectionPool | None = None
+
+# Insert columns per table; each matches the attribute name on its generate.py dataclass
+STATE_COLUMNS = ("id", "code", "name", "supervision_requirements", "review_frequency_days")
+PHYSICIAN_COLUMNS = ("id", "npi", "first_name", "last_name", "specialty", "state_license_id", "email", "phone")
+PROVIDER_COLUMNS = (
+    "id",
+    "npi",
+    "first_name",
+    "last_name",
+    "provider_type",
+    "supervising_physician_id",
+    "state_id",
+    "email",
+    "phone",
+    "hire_date",
+)
+CASE_COLUMNS = ("id", "provider_id", "patient_mrn", "case_type", "status", "priority", "created_at", "closed_at")
+CASE_REVIEW_COLUMNS = (
+    "id",
+    "case_id",
+    "physician_id",
+    "review_date",
+    "review_status",
+    "notes",
+    "due_date",
+    "completed_at",
+)
+
+
+def create_connection_pool() -> ThreadedConnectionPool:
+    """Open the connection pool with retry logic."""
     max_retries = 10
     retry_delay = 2
 
     for attempt in range(max_retries):
         try:
-            conn = psycopg2.connect(
+            return ThreadedConnectionPool(
+                1,
+                8,
                 host=os.environ.get("OLTP_HOST", "localhost"),
                 port=int(os.environ.get("OLTP_PORT", "5433")),
                 user=os.environ.get("OLTP_USER", "admin"),
                 password=os.environ.get("OLTP_PASSWORD", "oltp_secret"),
                 database=os.environ.get("OLTP_DB", "supervision"),
             )
-            return conn
         except psycopg2.OperationalError as e:
             if attempt < max_retries - 1:
                 print(f"Connection attempt {attempt + 1} failed, retrying in {retry_delay}s...")
@@ -31,18 +73,30 @@ def get_connection():
                 raise e
 
 
+def get_connection():
+    """Borrow a connection from the shared pool, opening the pool on first use."""
+    global CONNECTION_POOL
+    if CONNECTION_POOL is None:
+        CONNECTION_POOL = create_connection_pool()
+    return CONNECTION_POOL.getconn()
+
+
+def release_connection(conn):
+    """Return a connection to the shared pool so later seed phases reuse it."""
+    CONNECTION_POOL.putconn(conn)
+
+
+def copy_rows(cursor, table: str, columns: tuple[str, ...], rows) -> None:
+    """Bulk load rows into table with COPY FROM STDIN, bypassing per-statement INSERT parsing."""
+    buf = io.StringIO()
+    csv.writer(buf).writerows([COPY_NULL if v is None else v for v in row] for row in rows)
+    buf.seek(0)
+    cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT CSV, NULL '{COPY_NULL}')", buf)
+
+
 def seed_states(cursor, states):
     """Insert state records."""
-    values = [
-        (
-            s.id,
-            s.code,
-            s.name,
-            s.supervision_requirements,
-            s.review_frequency_days,
-        )
-        for s in states
-    ]
+    values = list(map(attrgetter(*STATE_COLUMNS), states))
 
     execute_values(
         cursor,
@@ -52,25 +106,15 @@ def seed_states(cursor, states):
         ON CONFLICT (code) DO NOTHING
         """,
         values,
+        template="(%s,%s,%s,%s,%s)",
+        page_size=PAGE_SIZE,
     )
     print(f"Inserted {len(values)} states")
 
 
 def seed_physicians(cursor, physicians):
     """Insert physician records."""
-    values = [
-        (
-            p.id,
-            p.npi,
-            p.first_name,
-            p.last_name,
-            p.specialty,
-            p.state_license_id,
-            p.email,
-            p.phone,
-        )
-        for p in physicians
-    ]
+    values = list(map(attrgetter(*PHYSICIAN_COLUMNS), physicians))
 
     execute_values(
         cursor,
@@ -81,27 +125,15 @@ def seed_physicians(cursor, physicians):
         ON CONFLICT (npi) DO NOTHING
         """,
         values,
+        template="(%s,%s,%s,%s,%s,%s,%s,%s)",
+        page_size=PAGE_SIZE,
     )
     print(f"Inserted {len(values)} physicians")
 
 
 def seed_providers(cursor, providers):
     """Insert provider records."""
-    values = [
-        (
-            p.id,
-            p.npi,
-            p.first_name,
-            p.last_name,
-            p.provider_type,
-            p.supervising_physician_id,
-            p.state_id,
-            p.email,
-            p.phone,
-            p.hire_date,
-        )
-        for p in providers
-    ]
+    values = list(map(attrgetter(*PROVIDER_COLUMNS), providers))
 
     execute_values(
         cursor,
@@ -112,33 +144,20 @@ def seed_providers(cursor, providers):
         ON CONFLICT (npi) DO NOTHING
         """,
         values,
+        template="(%s,%s,%s,%s,%s,%s,%s,%s,%s,%s)",
+        page_size=PAGE_SIZE,
     )
     print(f"Inserted {len(values)} providers")
 
 
 def seed_cases(cursor, cases):
     """Insert case records."""
-    values = [
-        (
-            c.id,
-            c.provider_id,
-            c.patient_mrn,
-            c.case_type,
-            c.status,
-            c.priority,
-            c.created_at,
-            c.closed_at,
-        )
-        for c in cases
-    ]
+    values = list(map(attrgetter(*CASE_COLUMNS), cases))
 
-    execute_values(
+    copy_rows(
         cursor,
-        """
-        INSERT INTO cases (id, provider_id, patient_mrn, case_type, status,
-                          priority, created_at, closed_at)
-        VALUES %s
-        """,
+        "cases",
+        CASE_COLUMNS,
         values,
     )
     print(f"Inserted {len(values)} cases")
@@ -146,27 +165,12 @@ def seed_cases(cursor, cases):
 
 def seed_case_reviews(cursor, reviews):
     """Insert case review records."""
-    values = [
-        (
-            r.id,
-            r.case_id,
-            r.physician_id,
-            r.review_date,
-            r.review_status,
-            r.notes,
-            r.due_date,
-            r.completed_at,
-        )
-        for r in reviews
-    ]
+    values = list(map(attrgetter(*CASE_REVIEW_COLUMNS), reviews))
 
-    execute_values(
+    copy_rows(
         cursor,
-        """
-        INSERT INTO case_reviews (id, case_id, physician_id, review_date,
-                                  review_status, notes, due_date, completed_at)
-        VALUES %s
-        """,
+        "case_reviews",
+        CASE_REVIEW_COLUMNS,
         values,
     )
     print(f"Inserted {len(values)} case reviews")
@@ -174,17 +178,24 @@ def seed_case_reviews(cursor, reviews):
 
 def seed_database():
     """Main function to seed the OLTP database."""
-    print("Generating synthetic data...")
-    data = generate_all_data()
-    oltp_data = data["oltp"]
+    # Connect (and ride out the retry loop while Postgres starts) while the data generates
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        print("Connecting to OLTP database...")
+        conn_future = executor.submit(get_connection)
+
+        print("Generating synthetic data...")
+        oltp_data = generate_oltp_data()
+
+        conn = conn_future.result()
 
-    print("Connecting to OLTP database...")
-    conn = get_connection()
     cursor = conn.cursor()
 
     try:
         print("Seeding database...")
 
+        # Seed data is regenerated on demand, so don't wait on WAL flushes at commit
+        cursor.execute("SET LOCAL synchronous_commit = OFF")
+
         # Seed in order of dependencies
         seed_states(cursor, oltp_data["states"])
         seed_physicians(cursor, oltp_data["physicians"])
@@ -201,7 +212,7 @@ def seed_database():
         raise
     finally:
         cursor.close()
-        conn.close()
+        release_connection(conn)
 
 
 if __name__ == "__main__":
@@ -1,27 +1,147 @@
 """Seed S3 bucket with CSV/Excel files and send HL7v2 messages via MLLP."""
 
 import csv
+import hashlib
 import io
 import os
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
 
 import boto3
 import pandas as pd
+from boto3.s3.transfer import TransferConfig
 from botocore.config import Config
+from botocore.exceptions import ClientError
 from generate import generate_all_data
 from generate_hl7 import send_hl7_messages
 
-
-def get_s3_client():
-    """Get S3 client configured for LocalStack with retry logic."""
+# Bodies at or above the multipart threshold are uploaded in parallel parts
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * 1024**2,
+    multipart_chunksize=8 * 1024**2,
+    max_concurrency=8,
+    use_threads=True,
+)
+
+
+# More detailed state requirements for reference data
+STATE_REQUIREMENTS = {
+    "state_code": ["CA", "TX", "FL", "NY", "PA", "IL", "OH", "GA", "NC", "MI"],
+    "state_name": [
+        "California",
+        "Texas",
+        "Florida",
+        "New York",
+        "Pennsylvania",
+        "Illinois",
+        "Ohio",
+        "Georgia",
+        "North Carolina",
+        "Michigan",
+    ],
+    "np_practice_authority": [
+        "Full (after transition)",
+        "Reduced",
+        "Restricted",
+        "Reduced",
+        "Reduced",
+        "Full",
+        "Reduced",
+        "Restricted",
+        "Reduced",
+        "Reduced",
+    ],
+    "pa_supervision_required": [
+        "No",
+        "Yes",
+        "Yes",
+        "Yes",
+        "Yes",
+        "No",
+        "Yes",
+        "Yes",
+        "Yes",
+        "Yes",
+    ],
+    "chart_review_frequency_days": [30, 14, 7, 30, 30, 45, 14, 7, 14, 30],
+    "physician_patient_ratio_limit": [
+        "6:1",
+        "7:1",
+        "4:1",
+        "6:1",
+        "4:1",
+        "No limit",
+        "5:1",
+        "4:1",
+        "6:1",
+        "5:1",
+    ],
+    "telehealth_supervision_allowed": [
+        "Yes",
+        "Yes",
+        "Limited",
+        "Yes",
+        "Yes",
+        "Yes",
+        "Yes",
+        "Limited",
+        "Yes",
+        "Yes",
+    ],
+    "prescriptive_authority": [
+        "Full",
+        "Limited",
+        "Limited",
+        "Full",
+        "Limited",
+        "Full",
+        "Limited",
+        "Limited",
+        "Limited",
+        "Limited",
+    ],
+    "last_updated": [
+        "2024-01-15",
+        "2024-02-01",
+        "2023-12-01",
+        "2024-01-20",
+        "2023-11-15",
+        "2024-03-01",
+        "2024-01-10",
+        "2023-10-01",
+        "2024-02-15",
+        "2024-01-05",
+    ],
+}
+
+# pandas Excel engine used to build the state requirements workbook
+STATE_REQUIREMENTS_ENGINE = "xlsxwriter"
+
+# The workbook is built from constant data, so it is cached on disk keyed by a digest of that data and its engine
+STATE_REQUIREMENTS_DIGEST = hashlib.sha256(repr((STATE_REQUIREMENTS_ENGINE, STATE_REQUIREMENTS)).encode()).hexdigest()
+STATE_REQUIREMENTS_XLSX = Path(__file__).parent / "cache" / f"state_requirements-{STATE_REQUIREMENTS_DIGEST[:12]}.xlsx"
+
+# Decorrelated-jitter backoff bounds (seconds) for the S3 connection loop
+RETRY_BASE_DELAY = 0.1
+RETRY_MAX_DELAY = 20
+# Separate from the module-level random that generate.py seeds, so jitter never shifts the synthetic data
+RETRY_RNG = random.Random()
+
+
+@lru_cache(maxsize=1)
+def get_s3_client(bucket_name: str):
+    """Get S3 client configured for LocalStack with retry logic, probing the target bucket; cached per process."""
     localstack_host = os.environ.get("LOCALSTACK_HOST", "localhost")
     endpoint_url = f"http://{localstack_host}:4566"
 
     max_retries = 10
-    retry_delay = 2
+    retry_delay = RETRY_BASE_DELAY
 
     config = Config(
-        retries={"max_attempts": 3, "mode": "standard"},
+        retries={"max_attempts": 3, "mode": "adaptive"},
         connect_timeout=5,
         read_timeout=10,
     )
@@ -36,12 +156,17 @@ def get_s3_client():
                 region_name=os.environ.get("AWS_DEFAULT_REGION", "us-east-1"),
                 config=config,
             )
-            # Test connection
-            client.list_buckets()
+            # Test connection; a missing bucket still proves S3 is answering
+            try:
+                client.head_bucket(Bucket=bucket_name)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchBucket"):
+                    raise
             return client
         except Exception as e:
             if attempt < max_retries - 1:
-                print(f"S3 connection attempt {attempt + 1} failed, retrying in {retry_delay}s...")
+                retry_delay = min(RETRY_MAX_DELAY, RETRY_RNG.uniform(RETRY_BASE_DELAY, retry_delay * 3))
+                print(f"S3 connection attempt {attempt + 1} failed, retrying in {retry_delay:.1f}s...")
                 time.sleep(retry_delay)
             else:
                 raise e
@@ -57,162 +182,102 @@ def ensure_bucket_exists(s3_client, bucket_name: str):
         s3_client.create_bucket(Bucket=bucket_name)
 
 
+def upload_bytes(s3_client, bucket_name: str, key: str, body: bytes, content_type: str):
+    """Upload body to S3: one put_object for small bodies, a multipart transfer for large ones."""
+    if len(body) < TRANSFER_CONFIG.multipart_threshold:
+        s3_client.put_object(Bucket=bucket_name, Key=key, Body=body, ContentType=content_type)
+        return
+    s3_client.upload_fileobj(
+        Fileobj=io.BytesIO(body),
+        Bucket=bucket_name,
+        Key=key,
+        ExtraArgs={"ContentType": content_type},
+        Config=TRANSFER_CONFIG,
+    )
+
+
+def csv_bytes(header: list[str], rows) -> bytes:
+    """Write a header and rows as UTF-8 CSV straight into a bytes buffer."""
+    output = io.BytesIO()
+    with io.TextIOWrapper(output, encoding="utf-8", newline="") as text:
+        writer = csv.writer(text)
+        writer.writerow(header)
+        writer.writerows(rows)
+        text.flush()
+        return output.getvalue()
+
+
+def property_fields(records: list[dict]) -> list[str]:
+    """Return the union of property names across records, in first-seen order."""
+    return list(dict.fromkeys(name for record in records for name in record["properties"]))
+
+
 def upload_contacts_csv(s3_client, bucket_name: str, contacts: list[dict]):
     """Upload HubSpot contacts as CSV."""
-    # Flatten the nested structure for CSV
-    rows = []
-    for contact in contacts:
-        row = {"id": contact["id"]}
-        row.update(contact["properties"])
-        rows.append(row)
-
-    # Create CSV in memory
-    output = io.StringIO()
-    if rows:
-        writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
+    # Flatten the nested structure for CSV: id followed by each property
+    body = b""
+    if contacts:
+        fields = property_fields(contacts)
+        body = csv_bytes(
+            ["id", *fields],
+            ((contact["id"], *map(contact["properties"].get, fields)) for contact in contacts),
+        )
 
-    s3_client.put_object(
-        Bucket=bucket_name,
-        Key="hubspot/contacts.csv",
-        Body=output.getvalue().encode("utf-8"),
-        ContentType="text/csv",
-    )
-    print(f"Uploaded {len(rows)} contacts to s3://{bucket_name}/hubspot/contacts.csv")
+    upload_bytes(s3_client, bucket_name, "hubspot/contacts.csv", body, "text/csv")
+    print(f"Uploaded {len(contacts)} contacts to s3://{bucket_name}/hubspot/contacts.csv")
+
+
+def deal_contact_id(deal: dict) -> str | None:
+    """Return the deal's first associated contact ID, if any."""
+    assoc = deal.get("associations", {}).get("contacts", {}).get("results", [])
+    return assoc[0]["id"] if assoc else None
 
 
 def upload_deals_csv(s3_client, bucket_name: str, deals: list[dict]):
     """Upload HubSpot deals as CSV."""
-    rows = []
-    for deal in deals:
-        row = {"id": deal["id"]}
-        row.update(deal["properties"])
+    body = b""
+    if deals:
         # Add associated contact ID if present
-        assoc = deal.get("associations", {}).get("contacts", {}).get("results", [])
-        row["contact_id"] = assoc[0]["id"] if assoc else None
-        rows.append(row)
-
-    output = io.StringIO()
-    if rows:
-        writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
+        fields = property_fields(deals)
+        body = csv_bytes(
+            ["id", *fields, "contact_id"],
+            ((deal["id"], *map(deal["properties"].get, fields), deal_contact_id(deal)) for deal in deals),
+        )
 
-    s3_client.put_object(
-        Bucket=bucket_name,
-        Key="hubspot/deals.csv",
-        Body=output.getvalue().encode("utf-8"),
-        ContentType="text/csv",
-    )
-    print(f"Uploaded {len(rows)} deals to s3://{bucket_name}/hubspot/deals.csv")
+    upload_bytes(s3_client, bucket_name, "hubspot/deals.csv", body, "text/csv")
+    print(f"Uploaded {len(deals)} deals to s3://{bucket_name}/hubspot/deals.csv")
 
 
-def upload_state_requirements_excel(s3_client, bucket_name: str):
-    """Upload state supervision requirements as Excel file."""
-    # More detailed state requirements for reference data
-    data = {
-        "state_code": ["CA", "TX", "FL", "NY", "PA", "IL", "OH", "GA", "NC", "MI"],
-        "state_name": [
-            "California",
-            "Texas",
-            "Florida",
-            "New York",
-            "Pennsylvania",
-            "Illinois",
-            "Ohio",
-            "Georgia",
-            "North Carolina",
-            "Michigan",
-        ],
-        "np_practice_authority": [
-            "Full (after transition)",
-            "Reduced",
-            "Restricted",
-            "Reduced",
-            "Reduced",
-            "Full",
-            "Reduced",
-            "Restricted",
-            "Reduced",
-            "Reduced",
-        ],
-        "pa_supervision_required": [
-            "No",
-            "Yes",
-            "Yes",
-            "Yes",
-            "Yes",
-            "No",
-            "Yes",
-            "Yes",
-            "Yes",
-            "Yes",
-        ],
-        "chart_review_frequency_days": [30, 14, 7, 30, 30, 45, 14, 7, 14, 30],
-        "physician_patient_ratio_limit": [
-            "6:1",
-            "7:1",
-            "4:1",
-            "6:1",
-            "4:1",
-            "No limit",
-            "5:1",
-            "4:1",
-            "6:1",
-            "5:1",
-        ],
-        "telehealth_supervision_allowed": [
-            "Yes",
-            "Yes",
-            "Limited",
-            "Yes",
-            "Yes",
-            "Yes",
-            "Yes",
-            "Limited",
-            "Yes",
-            "Yes",
-        ],
-        "prescriptive_authority": [
-            "Full",
-            "Limited",
-            "Limited",
-            "Full",
-            "Limited",
-            "Full",
-            "Limited",
-            "Limited",
-            "Limited",
-            "Limited",
-        ],
-        "last_updated": [
-            "2024-01-15",
-            "2024-02-01",
-            "2023-12-01",
-            "2024-01-20",
-            "2023-11-15",
-            "2024-03-01",
-            "2024-01-10",
-            "2023-10-01",
-            "2024-02-15",
-            "2024-01-05",
-        ],
-    }
-
-    df = pd.DataFrame(data)
-
-    # Create Excel in memory
+def state_requirements_xlsx() -> bytes:
+    """Return the state requirements workbook, building it with xlsxwriter only when not cached on disk."""
+    if STATE_REQUIREMENTS_XLSX.exists():
+        return STATE_REQUIREMENTS_XLSX.read_bytes()
+
     output = io.BytesIO()
-    with pd.ExcelWriter(output, engine="openpyxl") as writer:
-        df.to_excel(writer, sheet_name="State Requirements", index=False)
+    with pd.ExcelWriter(output, engine=STATE_REQUIREMENTS_ENGINE) as writer:
+        pd.DataFrame(STATE_REQUIREMENTS).to_excel(writer, sheet_name="State Requirements", index=False)
 
-    output.seek(0)
-    s3_client.put_object(
-        Bucket=bucket_name,
-        Key="reference/state_requirements.xlsx",
-        Body=output.getvalue(),
-        ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    body = output.getvalue()
+    # Write beside the cache file and rename over it, so a failed or interrupted write never leaves a truncated workbook
+    tmp_path = STATE_REQUIREMENTS_XLSX.with_name(f"{STATE_REQUIREMENTS_XLSX.name}.{os.getpid()}.tmp")
+    try:
+        STATE_REQUIREMENTS_XLSX.parent.mkdir(exist_ok=True)
+        tmp_path.write_bytes(body)
+        os.replace(tmp_path, STATE_REQUIREMENTS_XLSX)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        print(f"Could not cache {STATE_REQUIREMENTS_XLSX.name}: {e}")
+    return body
+
+
+def upload_state_requirements_excel(s3_client, bucket_name: str):
+    """Upload state supervision requirements as Excel file."""
+    upload_bytes(
+        s3_client,
+        bucket_name,
+        "reference/state_requirements.xlsx",
+        state_requirements_xlsx(),
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
     )
     print(f"Uploaded state requirements to s3://{bucket_name}/reference/state_requirements.xlsx")
 
@@ -226,15 +291,21 @@ def seed_s3():
     hubspot_data = data["hubspot"]
 
     print("Connecting to LocalStack S3...")
-    s3_client = get_s3_client()
+    s3_client = get_s3_client(bucket_name)
 
     print("Ensuring bucket exists...")
     ensure_bucket_exists(s3_client, bucket_name)
 
     print("Uploading HubSpot files to S3...")
-    upload_contacts_csv(s3_client, bucket_name, hubspot_data["contacts"])
-    upload_deals_csv(s3_client, bucket_name, hubspot_data["deals"])
-    upload_state_requirements_excel(s3_client, bucket_name)
+    # boto3 low-level clients are thread-safe, so the uploads share one client
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        uploads = [
+            executor.submit(upload_contacts_csv, s3_client, bucket_name, hubspot_data["contacts"]),
+            executor.submit(upload_deals_csv, s3_client, bucket_name, hubspot_data["deals"]),
+            executor.submit(upload_state_requirements_excel, s3_client, bucket_name),
+        ]
+        for upload in uploads:
+            upload.result()  # re-raise any upload failure
 
     print("Sending HL7v2 messages to MLLP engine...")
     hl7_host = os.environ.get("HL7_ENGINE_HOST", "mock-hl7-engine")